@@ -9,6 +9,7 @@ Usage:
     python run-gates.py --config .quality-gates.json --phase implementation
     python run-gates.py --gate pre-deploy --verbose
     python run-gates.py --list
+    python run-gates.py --budget 60
 
 Exit Codes:
     0 - All blocking gates passed
@@ -17,11 +18,16 @@ Exit Codes:
 """
 
 import argparse
+import hashlib
 import json
 import os
+import re
+import shutil
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -36,6 +42,7 @@ from typing import Optional
 VERSION = "1.0.0"
 DEFAULT_TIMEOUT = 300  # 5 minutes
 DEFAULT_CONFIG = ".quality-gates.json"
+DEFAULT_HISTORY = "quality-gates-history.json"
 
 
 class Severity(Enum):
@@ -72,6 +79,7 @@ class CheckResult:
     severity: Severity = Severity.CRITICAL
     remediation: list = field(default_factory=list)
     skip_reason: str = ""
+    shards: list = field(default_factory=list)
 
 
 @dataclass
@@ -87,6 +95,7 @@ class GateResult:
     passed: bool
     duration: float
     timestamp: str
+    deferred: list = field(default_factory=list)
 
 
 # =============================================================================
@@ -122,6 +131,11 @@ def load_gate_config(config_path: str) -> dict:
     if 'gates' not in config or not config['gates']:
         raise ValueError("Configuration missing required 'gates' array")
 
+    for gate in config['gates']:
+        for check in gate.get('checks', []):
+            resolve_shard_count(check)
+            get_write_paths(check)
+
     return config
 
 
@@ -170,8 +184,6 @@ def expand_env_vars(command: str, env: dict) -> str:
     Returns:
         Command with expanded variables
     """
-    import re
-
     def replace_var(match):
         var_expr = match.group(1)
         if ':-' in var_expr:
@@ -185,10 +197,70 @@ def expand_env_vars(command: str, env: dict) -> str:
     return re.sub(pattern, replace_var, command)
 
 
+def get_available_cpus() -> int:
+    """
+    Get the number of CPU cores this process may actually use.
+
+    Honors CPU affinity and cgroup v2 quotas (as set for CI containers),
+    falling back to the host core count.
+
+    Returns:
+        Number of usable cores (at least 1)
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        cpus = os.cpu_count() or 1
+
+    try:
+        with open('/sys/fs/cgroup/cpu.max', 'r', encoding='utf-8') as f:
+            quota, period = f.read().split()[:2]
+        if quota != 'max':
+            cpus = min(cpus, max(int(int(quota) / int(period)), 1))
+    except (OSError, ValueError):
+        pass
+
+    return max(cpus, 1)
+
+
+# Bounds concurrently running shards across all checks, including checks
+# run side by side with parallel_checks
+SHARD_SLOTS = threading.BoundedSemaphore(get_available_cpus())
+
+
+def resolve_shard_count(check: dict) -> int:
+    """
+    Resolve the number of shards a check should be split into.
+
+    Args:
+        check: Check configuration dictionary
+
+    Returns:
+        Number of concurrent shard instances (1 means no sharding)
+
+    Raises:
+        ValueError: If the shard option is invalid
+    """
+    shard = check.get('shard', 1)
+
+    if shard == 'auto':
+        return get_available_cpus()
+    if isinstance(shard, bool) or not isinstance(shard, int) or shard < 1:
+        raise ValueError(
+            f"Invalid shard value for check '{check.get('name', check.get('type', 'unknown'))}': "
+            f"{shard!r} (expected a positive integer or 'auto')"
+        )
+
+    return shard
+
+
 def run_check(check: dict, defaults: dict, verbose: bool = False) -> CheckResult:
     """
     Execute a single check and return the result.
 
+    Checks with a ``shard`` option are split into concurrent instances
+    and merged into one result.
+
     Args:
         check: Check configuration dictionary
         defaults: Default configuration values
@@ -200,17 +272,6 @@ def run_check(check: dict, defaults: dict, verbose: bool = False) -> CheckResult
     check_id = check.get('id', check.get('type', 'unknown'))
     name = check.get('name', check_id)
     severity = Severity(check.get('severity', 'critical'))
-    timeout = check.get('timeout', defaults.get('timeout', DEFAULT_TIMEOUT))
-    expected_exit = check.get('expected_exit_code', 0)
-    remediation_data = check.get('remediation', {})
-
-    # Handle remediation as dict or list
-    if isinstance(remediation_data, dict):
-        remediation = remediation_data.get('manual_steps', [])
-    elif isinstance(remediation_data, list):
-        remediation = remediation_data
-    else:
-        remediation = []
 
     # Build environment
     env = os.environ.copy()
@@ -230,6 +291,41 @@ def run_check(check: dict, defaults: dict, verbose: bool = False) -> CheckResult
             skip_reason=skip_reason
         )
 
+    shard_total = resolve_shard_count(check)
+    if shard_total > 1:
+        return run_sharded_check(check, defaults, env, shard_total, verbose)
+
+    return execute_check(check, defaults, env, verbose)
+
+
+def execute_check(check: dict, defaults: dict, env: dict, verbose: bool = False) -> CheckResult:
+    """
+    Run a check's command once in the given environment.
+
+    Args:
+        check: Check configuration dictionary
+        defaults: Default configuration values
+        env: Environment variables for execution
+        verbose: Whether to print verbose output
+
+    Returns:
+        CheckResult with execution details
+    """
+    check_id = check.get('id', check.get('type', 'unknown'))
+    name = check.get('name', check_id)
+    severity = Severity(check.get('severity', 'critical'))
+    timeout = check.get('timeout', defaults.get('timeout', DEFAULT_TIMEOUT))
+    expected_exit = check.get('expected_exit_code', 0)
+    remediation_data = check.get('remediation', {})
+
+    # Handle remediation as dict or list
+    if isinstance(remediation_data, dict):
+        remediation = remediation_data.get('manual_steps', [])
+    elif isinstance(remediation_data, list):
+        remediation = remediation_data
+    else:
+        remediation = []
+
     # Expand command variables
     command = expand_env_vars(check.get('command', ''), env)
 
@@ -317,10 +413,760 @@ def run_check(check: dict, defaults: dict, verbose: bool = False) -> CheckResult
         )
 
 
+def run_sharded_check(check: dict, defaults: dict, env: dict, shard_total: int,
+                      verbose: bool = False) -> CheckResult:
+    """
+    Run a check as concurrent shard instances and merge the results.
+
+    Each shard receives SHARD_INDEX (1-based), SHARD_TOTAL and
+    SHARD_WORKERS (CPU cores available per shard) in its environment, so
+    commands can reference ${SHARD_INDEX}/${SHARD_TOTAL}. At most one shard
+    per usable core runs at a time across all checks; the rest queue. The
+    merged check passes only if every shard passes.
+
+    Args:
+        check: Check configuration dictionary
+        defaults: Default configuration values
+        env: Environment variables shared by all shards
+        shard_total: Number of shards to run
+        verbose: Whether to print verbose output
+
+    Returns:
+        Merged CheckResult with per-shard results in ``shards``
+    """
+    command = check.get('command', '')
+    if 'SHARD_INDEX' not in command:
+        print(
+            f"Warning: Sharded check '{check.get('name', check.get('type', 'unknown'))}' does not "
+            f"reference SHARD_INDEX; unless it reads it from the environment, every shard "
+            f"runs the whole suite",
+            file=sys.stderr
+        )
+
+    cpus = get_available_cpus()
+    shard_workers = max(cpus // shard_total, 1)
+
+    shard_envs = []
+    for index in range(1, shard_total + 1):
+        shard_env = env.copy()
+        shard_env['SHARD_INDEX'] = str(index)
+        shard_env['SHARD_TOTAL'] = str(shard_total)
+        shard_env['SHARD_WORKERS'] = str(shard_workers)
+        shard_envs.append(shard_env)
+
+    if verbose:
+        print(f"  Sharding: {shard_total} instances, up to {min(shard_total, cpus)} at a time")
+        for index, shard_env in enumerate(shard_envs, 1):
+            print(f"  Shard {index}/{shard_total}: {expand_env_vars(command, shard_env)}")
+
+    start_time = time.time()
+
+    def run_shard(shard_env):
+        with SHARD_SLOTS:
+            return execute_check(check, defaults, shard_env)
+
+    with ThreadPoolExecutor(max_workers=min(shard_total, cpus)) as executor:
+        shards = list(executor.map(run_shard, shard_envs))
+
+    duration = time.time() - start_time
+
+    # Worst shard status determines the merged status
+    status = CheckStatus.PASS
+    for candidate in (CheckStatus.WARN, CheckStatus.FAIL, CheckStatus.ERROR):
+        if any(shard.status == candidate for shard in shards):
+            status = candidate
+
+    worst = next(shard for shard in shards if shard.status == status)
+
+    output = []
+    error = []
+    for index, shard in enumerate(shards, 1):
+        header = f"--- shard {index}/{shard_total} ---"
+        if shard.output:
+            output.append(f"{header}\n{shard.output}")
+        if shard.error:
+            error.append(f"{header}\n{shard.error}")
+
+    return CheckResult(
+        check_id=worst.check_id,
+        name=worst.name,
+        status=status,
+        command=check.get('command', ''),
+        duration=duration,
+        exit_code=worst.exit_code,
+        output='\n'.join(output),
+        error='\n'.join(error),
+        severity=worst.severity,
+        remediation=worst.remediation,
+        shards=shards
+    )
+
+
+# =============================================================================
+# Workspace Snapshots
+# =============================================================================
+
+def get_write_paths(check: dict) -> list:
+    """
+    Get the normalized paths a check declares it writes.
+
+    Args:
+        check: Check configuration dictionary
+
+    Returns:
+        List of relative paths (empty for read-only checks)
+
+    Raises:
+        ValueError: If the writes option is invalid
+    """
+    writes = check.get('writes', [])
+
+    if not isinstance(writes, list) or not all(isinstance(w, str) and w.strip() for w in writes):
+        raise ValueError(
+            f"Invalid writes value for check '{check.get('name', check.get('type', 'unknown'))}': "
+            f"{writes!r} (expected a list of relative paths)"
+        )
+
+    paths = []
+    for write in writes:
+        path = os.path.normpath(write.strip())
+        if os.path.isabs(path) or path in ('.', '..') or path.startswith('..' + os.sep):
+            raise ValueError(
+                f"Invalid writes path for check '{check.get('name', check.get('type', 'unknown'))}': "
+                f"{write!r} (must be relative and inside the working directory)"
+            )
+        paths.append(path)
+
+    return paths
+
+
+def is_under_paths(rel_path: str, paths: list) -> bool:
+    """Check whether a relative path equals or lies under any of the given paths."""
+    return any(rel_path == p or rel_path.startswith(p + os.sep) for p in paths)
+
+
+def find_workspace_root(path: Path) -> Path:
+    """
+    Get the root of the workspace containing a directory.
+
+    Inside a git repository this is the repository top level, so monorepo
+    packages keep their parent node_modules and shared config; otherwise
+    it is the directory itself.
+
+    Args:
+        path: Working directory of a check
+
+    Returns:
+        Absolute path of the workspace root
+    """
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--show-toplevel'],
+            cwd=path, capture_output=True, text=True, timeout=30
+        )
+    except (FileNotFoundError, NotADirectoryError, subprocess.TimeoutExpired):
+        return path
+
+    if result.returncode != 0 or not result.stdout.strip():
+        return path
+
+    return Path(result.stdout.strip()).resolve()
+
+
+def get_snapshot_path(gate_id: str, check: dict, defaults: dict) -> Optional[Path]:
+    """
+    Get the reusable snapshot directory for a check.
+
+    Snapshots live under the ``snapshot_dir`` option, keyed by workspace
+    and check, so they persist and are refreshed incrementally across
+    runs. Inside a git repository the default is a directory next to the
+    repository, which shares its filesystem (so files can be hardlinked)
+    without showing up in tools that scan the project. Outside git there
+    is no default and ``snapshot_dir`` must be set.
+
+    Args:
+        gate_id: Identifier of the gate containing the check
+        check: Check configuration dictionary
+        defaults: Default configuration values
+
+    Returns:
+        Path of the snapshot directory, or None if no location is configured
+    """
+    working_dir = Path(check.get('working_dir', defaults.get('working_dir', '.'))).resolve()
+    root = find_workspace_root(working_dir)
+
+    base = defaults.get('snapshot_dir')
+    if not base:
+        if find_git_dir(root) is None:
+            return None
+        base = root.parent / f".{root.name}-gate-snapshots"
+
+    workspace_hash = hashlib.sha1(str(root).encode('utf-8')).hexdigest()[:12]
+    slug = re.sub(r'[^a-z0-9_.-]+', '-', get_check_key(gate_id, check).lower()).strip('-')
+
+    return Path(base).resolve() / workspace_hash / slug
+
+
+def file_signature(path: Path) -> tuple:
+    """Get a (mtime_ns, size) signature of a path without following symlinks."""
+    stat = os.lstat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def remove_path(path: Path) -> None:
+    """Remove a file, symlink or directory tree if it exists."""
+    if path.is_symlink() or path.is_file():
+        path.unlink()
+    elif path.is_dir():
+        shutil.rmtree(path)
+
+
+def walk_files(root: Path, rel_dir: str) -> list:
+    """
+    List files and symlinks under a directory, without following symlinks.
+
+    Args:
+        root: Base directory
+        rel_dir: Directory relative to root to walk
+
+    Returns:
+        List of paths relative to root
+    """
+    paths = []
+
+    for dirpath, dirnames, filenames in os.walk(root / rel_dir):
+        for dirname in list(dirnames):
+            if os.path.islink(os.path.join(dirpath, dirname)):
+                paths.append(os.path.relpath(os.path.join(dirpath, dirname), root))
+                dirnames.remove(dirname)
+        for filename in filenames:
+            paths.append(os.path.relpath(os.path.join(dirpath, filename), root))
+
+    return paths
+
+
+def copy_entry(src: Path, dst: Path) -> None:
+    """
+    Copy a file or symlink, skipping copies that are already up to date.
+
+    An existing copy is considered up to date when its size and mtime
+    match the source (copy2 preserves mtime).
+
+    Args:
+        src: Source file or symlink
+        dst: Destination path
+    """
+    if src.is_symlink():
+        if dst.is_symlink() and os.readlink(dst) == os.readlink(src):
+            return
+        remove_path(dst)
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        os.symlink(os.readlink(src), dst)
+        return
+
+    if (dst.is_file() and not dst.is_symlink() and not os.path.samefile(src, dst)
+            and file_signature(src) == file_signature(dst)):
+        return
+
+    remove_path(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(src, dst)
+
+
+def list_workspace_files(source: Path, exclude: Path) -> tuple:
+    """
+    List the files making up a workspace.
+
+    Inside a git repository this is the tracked, untracked and ignored
+    files, with ignored directories (e.g. node_modules) listed separately
+    so they can be shared rather than copied. Outside git every file is
+    listed.
+
+    Args:
+        source: Workspace root
+        exclude: Directory to leave out (the snapshot location)
+
+    Returns:
+        Tuple of (files: list, shared_dirs: list) of relative paths
+    """
+    exclude_rel = os.path.relpath(exclude, source) if source in exclude.parents else None
+
+    def excluded(rel_path):
+        return exclude_rel is not None and is_under_paths(os.path.normpath(rel_path), [exclude_rel])
+
+    try:
+        listed = subprocess.run(
+            ['git', 'ls-files', '-z', '--cached', '--others', '--exclude-standard'],
+            cwd=source, capture_output=True, text=True, timeout=60
+        )
+        ignored = subprocess.run(
+            ['git', 'ls-files', '-z', '--others', '--ignored', '--exclude-standard', '--directory'],
+            cwd=source, capture_output=True, text=True, timeout=60
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        listed = ignored = None
+
+    if listed is not None and listed.returncode == 0 and ignored.returncode == 0:
+        files = []
+        shared_dirs = []
+        for rel_path in listed.stdout.split('\0') + ignored.stdout.split('\0'):
+            rel_path = rel_path.rstrip('/')
+            if not rel_path or excluded(rel_path):
+                continue
+            full_path = source / rel_path
+            if full_path.is_dir() and not full_path.is_symlink():
+                shared_dirs.append(os.path.normpath(rel_path))
+            elif full_path.is_file() or full_path.is_symlink():
+                files.append(os.path.normpath(rel_path))
+        return sorted(set(files)), sorted(set(shared_dirs))
+
+    files = []
+    for dirpath, dirnames, filenames in os.walk(source):
+        dirnames[:] = [
+            d for d in dirnames
+            if d != '.git' and not excluded(os.path.relpath(os.path.join(dirpath, d), source))
+        ]
+        for filename in filenames:
+            files.append(os.path.relpath(os.path.join(dirpath, filename), source))
+
+    return files, []
+
+
+def mirror_write_paths(source: Path, snapshot: Path, write_paths: list) -> dict:
+    """
+    Make the snapshot's write paths an exact copy of the workspace's.
+
+    Everything under a write path is copied (including ignored files) and
+    files no longer present in the workspace are removed, so the check
+    starts from the same state as an in-place run.
+
+    Args:
+        source: Workspace root
+        snapshot: Snapshot directory
+        write_paths: Workspace-relative paths the check writes
+
+    Returns:
+        Mapping of relative path to file signature after mirroring
+    """
+    state = {}
+
+    for write_path in write_paths:
+        src_root = source / write_path
+        dst_root = snapshot / write_path
+
+        if src_root.is_dir() and not src_root.is_symlink():
+            src_files = set(walk_files(source, write_path))
+            if dst_root.is_symlink() or dst_root.is_file():
+                dst_root.unlink()
+            dst_root.mkdir(parents=True, exist_ok=True)
+        elif os.path.lexists(src_root):
+            src_files = {write_path}
+        else:
+            src_files = set()
+
+        if dst_root.is_dir() and not dst_root.is_symlink():
+            if write_path in src_files:
+                shutil.rmtree(dst_root)
+            else:
+                for rel_path in walk_files(snapshot, write_path):
+                    if rel_path not in src_files:
+                        (snapshot / rel_path).unlink()
+        elif os.path.lexists(dst_root) and write_path not in src_files:
+            dst_root.unlink()
+
+        for rel_path in sorted(src_files):
+            copy_entry(source / rel_path, snapshot / rel_path)
+            state[rel_path] = file_signature(snapshot / rel_path)
+
+    return state
+
+
+def run_git(args: list, cwd: Path) -> str:
+    """
+    Run a git command for snapshot management.
+
+    Args:
+        args: Arguments after ``git``
+        cwd: Directory to run in
+
+    Returns:
+        Standard output of the command
+
+    Raises:
+        OSError: If git is unavailable or the command fails
+    """
+    try:
+        result = subprocess.run(
+            ['git'] + args, cwd=cwd, capture_output=True, text=True, timeout=120
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+        raise OSError(f"git {args[0]} failed: {e}")
+
+    if result.returncode != 0:
+        raise OSError(f"git {args[0]} failed: {result.stderr.strip()}")
+
+    return result.stdout
+
+
+def prepare_worktree(source: Path, snapshot: Path) -> None:
+    """
+    Make a snapshot directory a detached git worktree of the workspace.
+
+    The worktree is created without a checkout (the link farm supplies the
+    files) and is reused across runs; each run points its HEAD and index
+    at the workspace's current commit so git commands inside the snapshot
+    (git diff, jest --changedSince, lint-staged) see the same changes as
+    in the workspace, apart from staged-only state.
+
+    Args:
+        source: Repository root
+        snapshot: Snapshot directory
+
+    Raises:
+        OSError: If the worktree cannot be created or updated
+    """
+    head = run_git(['rev-parse', '--verify', 'HEAD'], source).strip()
+
+    if not (snapshot / '.git').is_file():
+        if snapshot.exists():
+            shutil.rmtree(snapshot)
+        snapshot.parent.mkdir(parents=True, exist_ok=True)
+        run_git(['worktree', 'prune'], source)
+        run_git(['worktree', 'add', '--detach', '--no-checkout', str(snapshot), head], source)
+
+    run_git(['reset', '--quiet', '--mixed', head], snapshot)
+
+
+def write_snapshot_excludes(source: Path, snapshot: Path, shared_dirs: list) -> Path:
+    """
+    Write a git excludes file covering the snapshot's symlinked directories.
+
+    Ignore patterns such as ``node_modules/`` only match real directories,
+    so the symlinks standing in for ignored directories would otherwise
+    show up as untracked in the snapshot worktree. The file also carries
+    over the user's global excludes, since it replaces core.excludesFile
+    for the check.
+
+    Args:
+        source: Repository root
+        snapshot: Snapshot directory
+        shared_dirs: Symlinked directories, relative to the snapshot
+
+    Returns:
+        Path of the excludes file
+    """
+    try:
+        global_excludes = run_git(['config', '--path', '--get', 'core.excludesFile'], source).strip()
+    except OSError:
+        config_home = os.environ.get('XDG_CONFIG_HOME') or os.path.expanduser('~/.config')
+        global_excludes = os.path.join(config_home, 'git', 'ignore')
+
+    lines = []
+    try:
+        with open(global_excludes, 'r', encoding='utf-8') as f:
+            lines.append(f.read())
+    except OSError:
+        pass
+
+    for rel_path in shared_dirs:
+        lines.append('/' + re.sub(r'([*?\[\\!#])', r'\\\1', rel_path.replace(os.sep, '/')))
+
+    excludes_path = snapshot.with_name(snapshot.name + '.exclude')
+    with open(excludes_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+
+    return excludes_path
+
+
+def prepare_snapshot(source: Path, snapshot: Path, write_paths: list) -> dict:
+    """
+    Create or refresh a snapshot of a workspace for an isolated check.
+
+    Workspace files, including git-ignored files such as .env.local, are
+    hardlinked into the snapshot; ignored directories such as node_modules
+    are symlinked. Declared write paths are mirrored as real copies so the
+    check's writes there cannot reach the original tree. Existing
+    snapshots are updated incrementally: unchanged links and copies are
+    kept, and entries no longer in the workspace are removed.
+
+    Inside a git repository the snapshot is also a git worktree (see
+    prepare_worktree), so git commands work in it.
+
+    Hardlinks share content with the workspace, so a check rewriting a
+    linked file in place changes the original; the returned state lets
+    find_leaked_writes detect that after the run.
+
+    Args:
+        source: Workspace root to snapshot
+        snapshot: Snapshot directory
+        write_paths: Workspace-relative paths the check writes
+
+    Returns:
+        State dictionary with the signatures of hardlinked files
+        (``linked``), mirrored write-path files (``writes``) and extra
+        environment variables for the check (``env``)
+    """
+    use_git = find_git_dir(source) is not None
+    if use_git:
+        prepare_worktree(source, snapshot)
+
+    manifest_path = snapshot.with_name(snapshot.name + '.manifest.json')
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            previous = set(json.load(f))
+    except (OSError, json.JSONDecodeError, TypeError):
+        previous = set()
+
+    files, shared_dirs = list_workspace_files(source, snapshot)
+
+    # Ignored directories enclosing a write path are linked file by file
+    enclosing = [
+        d for d in shared_dirs
+        if not is_under_paths(d, write_paths) and any(is_under_paths(w, [d]) for w in write_paths)
+    ]
+    for rel_dir in enclosing:
+        files.extend(walk_files(source, rel_dir))
+    shared_dirs = [
+        d for d in shared_dirs
+        if not is_under_paths(d, write_paths) and d not in enclosing
+    ]
+    files = [
+        f for f in files
+        if not is_under_paths(f, write_paths) and not is_under_paths(f, shared_dirs)
+    ]
+
+    snapshot.mkdir(parents=True, exist_ok=True)
+
+    # Prune stale entries first so a directory that used to be shared
+    # (symlinked) is never written through into the workspace
+    current = set(files) | set(shared_dirs)
+    for rel_path in sorted(previous - current, key=len):
+        if is_under_paths(rel_path, write_paths):
+            continue
+        parents = Path(rel_path).parents
+        if any((snapshot / parent).is_symlink() for parent in parents if str(parent) != '.'):
+            continue
+        remove_path(snapshot / rel_path)
+
+    linked = {}
+
+    for rel_path in files:
+        src = source / rel_path
+        dst = snapshot / rel_path
+
+        if src.is_symlink():
+            copy_entry(src, dst)
+            continue
+
+        if dst.is_dir() and not dst.is_symlink():
+            shutil.rmtree(dst)
+
+        up_to_date = dst.is_file() and not dst.is_symlink() and (
+            os.path.samefile(src, dst) or file_signature(src) == file_signature(dst)
+        )
+        if not up_to_date:
+            remove_path(dst)
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(src, dst)
+            except OSError:
+                # Cross-device or unsupported filesystem
+                shutil.copy2(src, dst)
+
+        if os.path.samefile(src, dst):
+            linked[rel_path] = file_signature(dst)
+
+    for rel_path in shared_dirs:
+        dst = snapshot / rel_path
+        target = str(source / rel_path)
+        if dst.is_symlink() and os.readlink(dst) == target:
+            continue
+        remove_path(dst)
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        os.symlink(target, dst)
+
+    writes = mirror_write_paths(source, snapshot, write_paths)
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(sorted(current), f)
+
+    env = {}
+    if use_git:
+        excludes_path = write_snapshot_excludes(source, snapshot, shared_dirs)
+        index = int(os.environ.get('GIT_CONFIG_COUNT', '0') or 0)
+        env = {
+            'GIT_CONFIG_COUNT': str(index + 1),
+            f'GIT_CONFIG_KEY_{index}': 'core.excludesFile',
+            f'GIT_CONFIG_VALUE_{index}': str(excludes_path),
+        }
+
+    return {'linked': linked, 'writes': writes, 'env': env}
+
+
+def find_leaked_writes(source: Path, snapshot: Path, state: dict) -> list:
+    """
+    Find hardlinked files a check modified in place.
+
+    Such writes bypass the snapshot and change the original workspace.
+
+    Args:
+        source: Workspace root
+        snapshot: Snapshot directory
+        state: State returned by prepare_snapshot
+
+    Returns:
+        Sorted list of modified relative paths
+    """
+    leaked = []
+
+    for rel_path, signature in state['linked'].items():
+        dst = snapshot / rel_path
+        try:
+            if os.path.samefile(source / rel_path, dst) and file_signature(dst) != signature:
+                leaked.append(rel_path)
+        except OSError:
+            continue
+
+    return sorted(leaked)
+
+
+def collect_artifacts(snapshot: Path, target: Path, write_paths: list, state: dict) -> None:
+    """
+    Copy a check's changes under its write paths back to the workspace.
+
+    Only files the check created or modified are copied, and only files
+    the check deleted from the snapshot are deleted from the workspace.
+    Workspace files the snapshot never had are left alone, as are deleted
+    files that were changed in the workspace during the run.
+
+    Args:
+        snapshot: Snapshot directory the check ran in
+        target: Workspace root
+        write_paths: Workspace-relative paths the check writes
+        state: State returned by prepare_snapshot
+    """
+    before = state['writes']
+
+    for write_path in write_paths:
+        src_root = snapshot / write_path
+        if src_root.is_dir() and not src_root.is_symlink():
+            produced = walk_files(snapshot, write_path)
+        elif os.path.lexists(src_root):
+            produced = [write_path]
+        else:
+            produced = []
+
+        for rel_path in produced:
+            if before.get(rel_path) == file_signature(snapshot / rel_path):
+                continue
+            copy_entry(snapshot / rel_path, target / rel_path)
+
+    for rel_path, signature in before.items():
+        if os.path.lexists(snapshot / rel_path):
+            continue
+        dst = target / rel_path
+        if dst.is_symlink() or (dst.is_file() and file_signature(dst) == signature):
+            dst.unlink()
+
+
+def run_isolated_check(check: dict, defaults: dict, snapshot: Optional[Path],
+                       verbose: bool = False) -> CheckResult:
+    """
+    Run a write-conflicting check in its own workspace snapshot.
+
+    The check fails with an error if it modified hardlinked files outside
+    its declared write paths, since those writes reached the workspace.
+
+    Args:
+        check: Check configuration dictionary
+        defaults: Default configuration values
+        snapshot: Snapshot directory for this check (None if unconfigured)
+        verbose: Whether to print verbose output
+
+    Returns:
+        CheckResult with execution details
+    """
+    check_id = check.get('id', check.get('type', 'unknown'))
+
+    if snapshot is None:
+        return CheckResult(
+            check_id=check_id,
+            name=check.get('name', check_id),
+            status=CheckStatus.ERROR,
+            command=check.get('command', ''),
+            duration=0.0,
+            error="Isolated checks outside a git repository need snapshot_dir to be set",
+            severity=Severity(check.get('severity', 'critical')),
+            remediation=[
+                "Set snapshot_dir in global_options to a writable directory on the "
+                "same filesystem as the project (outside the project tree)"
+            ]
+        )
+
+    working_dir = Path(check.get('working_dir', defaults.get('working_dir', '.'))).resolve()
+    source = find_workspace_root(working_dir)
+    rel_working_dir = os.path.relpath(working_dir, source)
+    write_paths = [
+        os.path.normpath(os.path.join(rel_working_dir, write_path))
+        for write_path in get_write_paths(check)
+    ]
+
+    if verbose:
+        print(f"  Isolating in snapshot: {snapshot}")
+
+    start_time = time.time()
+
+    try:
+        state = prepare_snapshot(source, snapshot, write_paths)
+    except OSError as e:
+        return CheckResult(
+            check_id=check_id,
+            name=check.get('name', check_id),
+            status=CheckStatus.ERROR,
+            command=check.get('command', ''),
+            duration=time.time() - start_time,
+            error=f"Could not prepare workspace snapshot: {e}",
+            severity=Severity(check.get('severity', 'critical')),
+            remediation=[
+                "Check free disk space and permissions for snapshot_dir",
+                "Set snapshot_dir in global_options if the default location is not writable"
+            ]
+        )
+
+    isolated_dir = os.path.normpath(snapshot / rel_working_dir)
+    isolated_env = dict(check.get('env', {}), **state['env'])
+    result = run_check(dict(check, working_dir=isolated_dir, env=isolated_env), defaults, verbose)
+
+    leaked = find_leaked_writes(source, snapshot, state)
+
+    try:
+        collect_artifacts(snapshot, source, write_paths, state)
+    except OSError as e:
+        result.status = CheckStatus.ERROR
+        result.error += f"\nCould not collect artifacts from snapshot: {e}"
+
+    if leaked:
+        result.status = CheckStatus.ERROR
+        result.error += (
+            "\nCheck modified files outside its declared writes in place, "
+            "which changed the working tree:\n"
+            + '\n'.join(f"  {rel_path}" for rel_path in leaked[:20])
+        )
+        result.remediation = [
+            "Add the modified paths to the check's writes so they are copied, not hardlinked"
+        ] + result.remediation
+
+    return result
+
+
 def run_gate(gate: dict, defaults: dict, verbose: bool = False) -> GateResult:
     """
     Execute all checks in a gate and return the aggregate result.
 
+    With ``parallel_checks`` enabled, checks run concurrently; checks that
+    declare ``writes`` run in their own workspace snapshot while the rest
+    run in place.
+
     Args:
         gate: Gate configuration dictionary
         defaults: Default configuration values
@@ -338,12 +1184,37 @@ def run_gate(gate: dict, defaults: dict, verbose: bool = False) -> GateResult:
 
     checks = gate.get('checks', [])
     check_results = []
+    parallel = gate.get('parallel_checks', defaults.get('parallel_checks', False))
 
     start_time = time.time()
 
-    for check in checks:
-        result = run_check(check, defaults, verbose)
-        check_results.append(result)
+    if parallel and len(checks) > 1:
+        snapshots = [
+            get_snapshot_path(gate_id, check, defaults) if get_write_paths(check) else None
+            for check in checks
+        ]
+
+        # Per-check output from worker threads would interleave, so
+        # verbose details are printed up front, tagged by check
+        if verbose:
+            for check, snapshot in zip(checks, snapshots):
+                label = check.get('name', check.get('id', check.get('type', 'unknown')))
+                print(f"  [{label}] Running: {check.get('command', '')}")
+                if snapshot is not None:
+                    print(f"  [{label}] Isolating in snapshot: {snapshot}")
+
+        def run_concurrent(item):
+            check, snapshot = item
+            if get_write_paths(check):
+                return run_isolated_check(check, defaults, snapshot)
+            return run_check(check, defaults)
+
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            check_results = list(executor.map(run_concurrent, zip(checks, snapshots)))
+    else:
+        for check in checks:
+            result = run_check(check, defaults, verbose)
+            check_results.append(result)
 
     duration = time.time() - start_time
 
@@ -369,6 +1240,233 @@ def run_gate(gate: dict, defaults: dict, verbose: bool = False) -> GateResult:
     )
 
 
+# =============================================================================
+# Check History and Budget Planning
+# =============================================================================
+
+def get_check_key(gate_id: str, check: dict) -> str:
+    """Build the history key identifying a check within its gate."""
+    check_name = check.get('name', check.get('id', check.get('type', 'unknown')))
+    return f"{gate_id}::{check_name}"
+
+
+def find_git_dir(path: Path) -> Optional[Path]:
+    """
+    Locate the git directory of the repository containing a path.
+
+    Args:
+        path: Directory inside the repository
+
+    Returns:
+        Absolute path of the git directory, or None outside a repository
+    """
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--absolute-git-dir'],
+            cwd=path, capture_output=True, text=True, timeout=30
+        )
+    except (FileNotFoundError, NotADirectoryError, subprocess.TimeoutExpired):
+        return None
+
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+
+    return Path(result.stdout.strip())
+
+
+def get_default_history_path(config_path: str) -> str:
+    """
+    Get the default history file location for a configuration.
+
+    History is kept inside the git directory so recording it never dirties
+    the working tree; outside a repository it is written next to the
+    configuration file as a dotfile.
+
+    Args:
+        config_path: Path to the configuration file
+
+    Returns:
+        Path of the history file
+    """
+    config_dir = Path(config_path).resolve().parent
+    git_dir = find_git_dir(config_dir)
+
+    if git_dir is not None:
+        return str(git_dir / DEFAULT_HISTORY)
+
+    return str(config_dir / f".{DEFAULT_HISTORY}")
+
+
+def load_history(history_path: str) -> dict:
+    """
+    Load recorded check durations and failure counts.
+
+    A missing or unreadable history file yields an empty history.
+
+    Args:
+        history_path: Path to the history file
+
+    Returns:
+        History dictionary keyed by check
+    """
+    path = Path(history_path)
+
+    if path.exists():
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                history = json.load(f)
+            if isinstance(history.get('checks'), dict):
+                return history
+        except (OSError, json.JSONDecodeError, AttributeError):
+            pass
+
+    return {'version': '1.0', 'checks': {}}
+
+
+def save_history(history_path: str, history: dict) -> None:
+    """Write check history to disk."""
+    with open(history_path, 'w', encoding='utf-8') as f:
+        json.dump(history, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def update_history(history: dict, results: list) -> None:
+    """
+    Record durations and outcomes of executed checks.
+
+    Skipped checks only have their skip counted, so they are known to have
+    been evaluated. Warnings and errors count as failures.
+
+    Args:
+        history: History dictionary to update in place
+        results: List of GateResult objects
+    """
+    checks = history.setdefault('checks', {})
+
+    for gate_result in results:
+        for result in gate_result.checks:
+            key = f"{gate_result.gate_id}::{result.name}"
+            entry = checks.setdefault(key, {'runs': 0, 'failures': 0, 'total_duration': 0.0})
+
+            if result.status == CheckStatus.SKIP:
+                entry['skips'] = entry.get('skips', 0) + 1
+                continue
+
+            entry['runs'] += 1
+            entry['total_duration'] += result.duration
+            if result.status in (CheckStatus.FAIL, CheckStatus.WARN, CheckStatus.ERROR):
+                entry['failures'] += 1
+
+
+def estimate_check(gate_id: str, check: dict, defaults: dict, history: dict) -> tuple:
+    """
+    Estimate a check's duration and failure probability from history.
+
+    Checks without history are assumed to take their full timeout and
+    to fail half of the time, so they are never scheduled optimistically
+    (see plan_budget for how they are warmed up).
+
+    Args:
+        gate_id: Identifier of the gate containing the check
+        check: Check configuration dictionary
+        defaults: Default configuration values
+        history: History dictionary
+
+    Returns:
+        Tuple of (duration: float, failure_rate: float, has_history: bool)
+    """
+    entry = history.get('checks', {}).get(get_check_key(gate_id, check))
+
+    if not entry or not entry.get('runs'):
+        timeout = check.get('timeout', defaults.get('timeout', DEFAULT_TIMEOUT))
+        return float(timeout or DEFAULT_TIMEOUT), 0.5, False
+
+    duration = entry['total_duration'] / entry['runs']
+    # Laplace smoothing keeps rarely-run checks from looking infallible
+    failure_rate = (entry['failures'] + 1) / (entry['runs'] + 2)
+
+    return duration, failure_rate, True
+
+
+def plan_budget(gates: list, defaults: dict, history: dict, budget: float) -> list:
+    """
+    Select and order the checks to run within a time budget.
+
+    Checks marked ``required`` are always selected; those without history
+    run regardless of their cost, so they are not charged against the
+    budget. Remaining checks are picked greedily by expected failure
+    detection per second (failure rate divided by duration) until the
+    budget is spent. Within each gate, selected checks are ordered by that
+    same value, so cheap, failure-prone checks report first.
+
+    Checks without history would rarely win a slot at their assumed
+    full-timeout cost, so before filling the budget, the first one whose
+    timeout fits the budget left is reserved as a warm-up and run last to
+    record its history. Checks
+    that were skipped by ``skip_if`` are not warmed up, so they cannot
+    starve the others.
+
+    Args:
+        gates: List of gate configuration dictionaries
+        defaults: Default configuration values
+        history: History dictionary
+        budget: Time budget in seconds
+
+    Returns:
+        List of (gate, selected_checks, deferred_checks, warmup_checks)
+        tuples, where deferred entries are (check, estimated_duration,
+        has_history) tuples and warm-up checks are also in selected_checks
+    """
+    candidates = []
+    for gate_index, gate in enumerate(gates):
+        gate_id = gate.get('name', gate.get('id', 'unknown'))
+        for check_index, check in enumerate(gate.get('checks', [])):
+            duration, failure_rate, has_history = estimate_check(gate_id, check, defaults, history)
+            value = failure_rate / max(duration, 0.001)
+            entry = history.get('checks', {}).get(get_check_key(gate_id, check), {})
+            warmable = not has_history and not entry.get('skips')
+            candidates.append((gate_index, check_index, check, duration, value, has_history, warmable))
+
+    selected = set()
+    remaining = budget
+
+    for gate_index, check_index, check, duration, _, has_history, _ in candidates:
+        if check.get('required', False):
+            selected.add((gate_index, check_index))
+            if has_history:
+                remaining -= duration
+
+    # Reserve the warm-up slot before filling so unseen checks get a turn
+    warmup = next(
+        ((c[0], c[1], c[3]) for c in candidates
+         if c[6] and (c[0], c[1]) not in selected and c[3] <= remaining),
+        None
+    )
+    if warmup is not None:
+        remaining -= warmup[2]
+        warmup = warmup[:2]
+
+    optional = [c for c in candidates if (c[0], c[1]) not in selected and (c[0], c[1]) != warmup]
+    for gate_index, check_index, check, duration, _, _, _ in sorted(optional, key=lambda c: -c[4]):
+        if duration <= remaining:
+            selected.add((gate_index, check_index))
+            remaining -= duration
+
+    plan = []
+    for gate_index, gate in enumerate(gates):
+        gate_candidates = [c for c in candidates if c[0] == gate_index]
+        chosen = [c for c in gate_candidates if (c[0], c[1]) in selected]
+        chosen.sort(key=lambda c: -c[4])
+        warmups = [c for c in gate_candidates if (c[0], c[1]) == warmup]
+        deferred = [
+            (c[2], c[3], c[5]) for c in gate_candidates
+            if (c[0], c[1]) not in selected and (c[0], c[1]) != warmup
+        ]
+        plan.append((gate, [c[2] for c in chosen + warmups], deferred, [c[2] for c in warmups]))
+
+    return plan
+
+
 # =============================================================================
 # Output Formatting
 # =============================================================================
@@ -420,6 +1518,15 @@ def format_check_result(result: CheckResult, verbose: bool = False) -> str:
     lines.append(f"       Command: {result.command}")
     lines.append(f"       Duration: {duration}")
 
+    for index, shard in enumerate(result.shards, 1):
+        shard_line = (
+            f"       Shard {index}/{len(result.shards)}: "
+            f"{get_status_emoji(shard.status)} in {format_duration(shard.duration)}"
+        )
+        if shard.status != CheckStatus.PASS and shard.exit_code is not None:
+            shard_line += f" (exit {shard.exit_code})"
+        lines.append(shard_line)
+
     if result.status == CheckStatus.SKIP:
         lines.append(f"       Reason: {result.skip_reason}")
     elif result.exit_code is not None and result.status != CheckStatus.PASS:
@@ -455,9 +1562,35 @@ def format_gate_result(result: GateResult, verbose: bool = False) -> str:
         lines.append(format_check_result(check, verbose))
         lines.append("")
 
+    if result.deferred:
+        lines.append(f"DEFERRED (time budget): {len(result.deferred)} check(s) not run")
+        for name, estimate, has_history in result.deferred:
+            if has_history:
+                lines.append(f"       - {name} (est. {format_duration(estimate)})")
+            else:
+                lines.append(f"       - {name} (no recorded history)")
+        unseen = sum(1 for _, _, has_history in result.deferred if not has_history)
+        if unseen:
+            lines.append("")
+            lines.append(
+                f"WARNING: {unseen} check(s) deferred because they have no recorded history; "
+                f"one whose timeout fits is warmed up per budget run, "
+                f"or run the full gate once to record all."
+            )
+        lines.append("")
+        lines.append("Run the full gate (e.g. in CI) to cover deferred checks.")
+        lines.append("")
+
     lines.append(separator)
 
-    if result.passed:
+    if result.passed and result.deferred and not result.checks:
+        lines.append(f"RESULT: PARTIAL - No checks run, {len(result.deferred)} deferred")
+    elif result.passed and result.deferred:
+        lines.append(
+            f"RESULT: PASSED ({len(result.deferred)} deferred) - "
+            f"{len(result.checks)} check(s) run, deferred checks not verified"
+        )
+    elif result.passed:
         lines.append(f"RESULT: PASSED - All checks completed successfully")
     else:
         failed_count = sum(
@@ -504,7 +1637,16 @@ def format_report(results: list, config: dict) -> str:
     lines.append("### Summary")
     lines.append(f"- **Gates Executed**: {total_gates}")
     lines.append(f"- **Gates Passed**: {passed_gates}/{total_gates}")
-    lines.append(f"- **Status**: {'BLOCKED' if blocked else 'PASSED'}")
+    deferred_count = sum(len(r.deferred) for r in results)
+    if blocked:
+        status = 'BLOCKED'
+    elif deferred_count:
+        status = f'PASSED ({deferred_count} deferred)'
+    else:
+        status = 'PASSED'
+    lines.append(f"- **Status**: {status}")
+    if deferred_count:
+        lines.append(f"- **Deferred Checks**: {deferred_count} (time budget, run full gate in CI)")
     lines.append("")
 
     # Individual gates
@@ -523,6 +1665,13 @@ def format_report(results: list, config: dict) -> str:
             status = get_status_emoji(check.status)
             duration = format_duration(check.duration)
             lines.append(f"| {check.name} | {status} | {duration} |")
+            for index, shard in enumerate(check.shards, 1):
+                shard_status = get_status_emoji(shard.status)
+                shard_duration = format_duration(shard.duration)
+                lines.append(
+                    f"| {check.name} (shard {index}/{len(check.shards)}) "
+                    f"| {shard_status} | {shard_duration} |"
+                )
 
         lines.append("")
 
@@ -537,6 +1686,15 @@ def format_report(results: list, config: dict) -> str:
                         lines.append(f"  - {step}")
             lines.append("")
 
+        if result.deferred:
+            lines.append("**Deferred Checks (time budget):**")
+            for name, estimate, has_history in result.deferred:
+                if has_history:
+                    lines.append(f"- {name} (est. {format_duration(estimate)})")
+                else:
+                    lines.append(f"- {name} (no recorded history)")
+            lines.append("")
+
     return '\n'.join(lines)
 
 
@@ -585,6 +1743,7 @@ Examples:
   python run-gates.py --gate pre-deploy --verbose
   python run-gates.py --list
   python run-gates.py --report-only > gate-report.md
+  python run-gates.py --budget 60
         """
     )
 
@@ -622,6 +1781,19 @@ Examples:
         help='Output markdown report only (for progress.md)'
     )
 
+    parser.add_argument(
+        '--budget', '-b',
+        type=float,
+        metavar='SECONDS',
+        help='Run only the highest-value checks that fit in SECONDS (required checks always run)'
+    )
+
+    parser.add_argument(
+        '--history',
+        help=f'Path to check duration/failure history file '
+             f'(default: {DEFAULT_HISTORY} in the git directory, else next to the config)'
+    )
+
     parser.add_argument(
         '--version',
         action='version',
@@ -671,14 +1843,34 @@ Examples:
         print("Error: No gates to run", file=sys.stderr)
         return 2
 
+    if args.budget is not None and args.budget <= 0:
+        print("Error: --budget must be a positive number of seconds", file=sys.stderr)
+        return 2
+
+    history_path = args.history or get_default_history_path(args.config)
+    history = load_history(history_path)
+
+    # Plan checks within the time budget, or run everything
+    if args.budget is not None:
+        plan = plan_budget(gates, defaults, history, args.budget)
+    else:
+        plan = [(gate, gate.get('checks', []), [], []) for gate in gates]
+
     # Run gates
     results = []
 
-    for gate in gates:
+    for gate, checks, deferred, warmups in plan:
         if not args.report_only:
             print(f"\nRunning gate: {gate.get('name', gate.get('id'))}...\n")
-
-        result = run_gate(gate, defaults, args.verbose)
+            for check in warmups:
+                print(f"Warm-up: running '{check.get('name', check.get('type'))}' "
+                      f"to record its history (may exceed the budget)\n")
+
+        result = run_gate(dict(gate, checks=checks), defaults, args.verbose)
+        result.deferred = [
+            (check.get('name', check.get('id', check.get('type', 'unknown'))), estimate, has_history)
+            for check, estimate, has_history in deferred
+        ]
         results.append(result)
 
         if not args.report_only:
@@ -695,6 +1887,13 @@ Examples:
             print("=" * 70 + "\n")
             print(report)
 
+    # Record durations and outcomes for future budget planning
+    update_history(history, results)
+    try:
+        save_history(history_path, history)
+    except OSError as e:
+        print(f"Warning: Could not save check history: {e}", file=sys.stderr)
+
     # Determine exit code
     blocking_failures = [
         r for r in results
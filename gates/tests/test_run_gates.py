@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for the AGENT-11 Quality Gate Runner.
+
+Pure Python (unittest), no external dependencies.
+
+Usage:
+    python -m unittest discover gates/tests
+"""
+
+import importlib.util
+import unittest
+from pathlib import Path
+
+
+RUNNER_PATH = Path(__file__).resolve().parent.parent / "run-gates.py"
+
+spec = importlib.util.spec_from_file_location("run_gates", RUNNER_PATH)
+run_gates = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(run_gates)
+
+
+def empty_history() -> dict:
+    return {'version': '1.0', 'checks': {}}
+
+
+def planned_warmups(plan: list) -> list:
+    return [check['name'] for _, _, _, warmups in plan for check in warmups]
+
+
+class BudgetWarmupTests(unittest.TestCase):
+    """Warm-up scheduling of checks without recorded history."""
+
+    def test_skipped_check_does_not_starve_other_warmups(self):
+        gates = [{
+            'name': 'g',
+            'checks': [
+                {'type': 'lint', 'name': 's', 'command': 'true', 'skip_if': 'true', 'timeout': 5},
+                {'type': 'lint', 'name': 'a', 'command': 'true', 'timeout': 5},
+                {'type': 'lint', 'name': 'b', 'command': 'true', 'timeout': 5},
+            ]
+        }]
+        history = empty_history()
+        warmups = []
+
+        for _ in range(3):
+            plan = run_gates.plan_budget(gates, {}, history, budget=6)
+            warmups.extend(planned_warmups(plan))
+            results = [
+                run_gates.run_gate(dict(gate, checks=checks), {})
+                for gate, checks, _, _ in plan
+            ]
+            run_gates.update_history(history, results)
+
+        self.assertEqual(warmups, ['s', 'a', 'b'])
+        self.assertEqual(history['checks']['g::s']['skips'], 1)
+        self.assertEqual(history['checks']['g::s']['runs'], 0)
+
+    def test_warmup_must_fit_remaining_budget(self):
+        gates = [{
+            'name': 'g',
+            'checks': [
+                {'type': 'test', 'name': 'e2e', 'command': 'true', 'timeout': 500},
+            ]
+        }]
+
+        plan = run_gates.plan_budget(gates, {}, empty_history(), budget=2)
+
+        self.assertEqual(planned_warmups(plan), [])
+        _, selected, deferred, _ = plan[0]
+        self.assertEqual(selected, [])
+        self.assertEqual([check['name'] for check, _, _ in deferred], ['e2e'])
+
+    def test_unseen_required_check_does_not_consume_budget(self):
+        gates = [{
+            'name': 'g',
+            'checks': [
+                {'type': 'build', 'name': 'req', 'command': 'true', 'required': True},
+                {'type': 'lint', 'name': 'lint', 'command': 'true', 'timeout': 5},
+            ]
+        }]
+
+        plan = run_gates.plan_budget(gates, {}, empty_history(), budget=10)
+
+        _, selected, deferred, warmups = plan[0]
+        self.assertEqual([check['name'] for check in selected], ['req', 'lint'])
+        self.assertEqual([check['name'] for check in warmups], ['lint'])
+        self.assertEqual(deferred, [])
+
+
+if __name__ == '__main__':
+    unittest.main()